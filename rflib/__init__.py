@@ -1,6 +1,7 @@
 import rflib.antennas
 import rflib.conversions
 import rflib.dielectrics
+import rflib.monochromatic
 import rflib.propagation
 
 
@@ -0,0 +1,74 @@
+"""Internal helpers shared between the submodules
+
+Not part of the public interface of `rflib`. These are the building blocks
+used by more than one submodule, e.g. the check for single numbers behind
+the scalar fast paths, and the relaxation terms of the dielectric models.
+"""
+
+from typing import List, Union
+import numpy as np
+
+
+def is_scalar(*values) -> bool:
+    """Checks whether all the values are single numbers rather than arrays
+
+    Python numbers, and NumPy scalars derived from `float`, are recognised
+    without calling `np.ndim`, which is comparatively slow for them.
+    """
+
+    return all(isinstance(value, (int, float)) or not np.ndim(value)
+               for value in values)
+
+
+def cole_cole_dispersion(ang_freq: Union[float, np.ndarray],
+                         er_static: float, er_inf: float, relax_time: float,
+                         alpha: float) -> Union[complex, np.ndarray]:
+    """Relaxation term of the Cole-Cole model
+
+    Evaluates the dispersive part of `cole_cole_single`, i.e. without the
+    static conductivity term, directly from the angular frequency in rad/s.
+    """
+
+    if not is_scalar(ang_freq):
+        # * Scaling by the real-valued relaxation time first means only one
+        # * complex temporary is created before the power is taken
+        temp_base = 1j * (ang_freq * relax_time)
+
+        return (er_static - er_inf) / (1 + np.power(temp_base, 1 - alpha))
+
+    # * For a single frequency Python's own complex power skips the ufunc
+    # * machinery of np.power, and like it copes with a zero base
+    temp_base = complex(0.0, ang_freq * relax_time)
+
+    return (er_static - er_inf) / (1 + temp_base ** (1 - alpha))
+
+
+def debye_dispersion(
+        ang_freq: Union[float, np.ndarray],
+        relax_times: Union[List[float], np.ndarray],
+        er_disps: Union[List[float], np.ndarray]
+) -> Union[complex, np.ndarray]:
+    """Sum of the relaxation terms of the multipole Debye model
+
+    Evaluates the dispersive part of `debye_multipole`, i.e. without the
+    static conductivity term, directly from the angular frequency in rad/s.
+    """
+
+    if isinstance(ang_freq, float):
+        # * With a single frequency there are only a handful of poles, so
+        # * plain complex arithmetic beats setting up the array expression.
+        # * Callers hand over a `float` here, which is cheaper to spot than
+        # * going through `is_scalar` a second time
+        er_complex = 0j
+        for relax_time, er_disp in zip(relax_times, er_disps):
+            er_complex += er_disp / complex(1.0, ang_freq * relax_time)
+
+        return er_complex
+
+    # * The outer product lays the frequencies out against the poles, which
+    # * are then collapsed in a single reduction. The denominator is built
+    # * in place to avoid a second frequency-by-pole complex temporary
+    denominator = 1j * np.multiply.outer(ang_freq, relax_times)
+    denominator += 1
+
+    return (er_disps / denominator).sum(axis=-1)
@@ -6,12 +6,28 @@ the design of antennas, but there is the intention to include ones for
 patch and horn antennas in the future.
 """
 
+import functools
+import math
 import warnings
+from typing import Optional, Union
 
 import numpy as np
-from scipy.constants import speed_of_light
 
-np.seterr(divide='raise', invalid='raise')
+from rflib._utils import is_scalar
+from rflib.conversions import freq_to_wavelength
+
+_PI_SQUARED = np.pi ** 2
+
+
+# * Supported power units, keyed by both the documented spelling, which
+# * then skips the call to `str.lower`, and the lowercase form
+_POWER_UNITS = {'dBm': 'dbm', 'dbm': 'dbm', 'W': 'w', 'w': 'w'}
+
+# * Fraction of the first Fresnel zone that has to be kept clear
+_FRESNEL_ZONE_CLEARANCE = {'normal': 1.0, 'cheeky': 0.6}
+
+# * Size of resonant antennas as a fraction of the free-space wavelength
+_RESONANT_ANTENNA_SIZE = {'monopole': 0.25, 'dipole': 0.5}
 
 
 def hertzian_dipole_current(freq: float, power: float, length: float,
@@ -48,45 +64,64 @@ def hertzian_dipole_current(freq: float, power: float, length: float,
         RuntimeError: If the `dipole_current` evaluates to a negative number.
     """
 
-    if 'dbm' == units.lower():
-        power = np.float_power(10, power / 10)
+    units = _POWER_UNITS.get(units) or _POWER_UNITS.get(units.lower())
+
+    if 'dbm' == units:
+        power = 10.0 ** (power / 10)
         power /= 1e3
-    elif 'w' == units.lower():
+    elif 'w' == units:
         if 0 == power:
             raise ZeroDivisionError('Power in absolute units must be > 0')
     else:
         raise RuntimeError('Unsupported power units')
 
-    freq *= 1e9
-
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+    wavelength = freq_to_wavelength(freq)
 
     if length > (wavelength / 10):
         warnings.warn('Dipole is not electrically small',
                       category=RuntimeWarning)
 
-    try:
-        dipole_current = 40 * np.float_power(np.pi, 2) * \
-                         np.float_power(length / wavelength, 2)
-        dipole_current = power / dipole_current
-    except (ZeroDivisionError, FloatingPointError) as error:
-        raise ZeroDivisionError('Dipole length must be > 0'). \
-              with_traceback(error.__traceback__)
+    if 0 == length:
+        raise ZeroDivisionError('Dipole length must be > 0')
 
-    dipole_current = np.sqrt(dipole_current)
+    dipole_current = 40 * _PI_SQUARED * (length / wavelength) ** 2
+    dipole_current = power / dipole_current
 
-    if np.isnan(dipole_current):
+    if dipole_current < 0:
         raise RuntimeError('Dipole current somehow ended negative')
 
+    dipole_current = math.sqrt(dipole_current)
+
     return dipole_current
 
 
-def max_antenna_separation_full(freq: float, radius: float,
-                                mode: str = 'normal') -> float:
+@functools.lru_cache(maxsize=1024)
+def _max_antenna_separation_full_scalar(freq: float, radius: float,
+                                        mode: str) -> float:
+    """Memoised single-value version of `max_antenna_separation_full`"""
+
+    return _max_antenna_separation_full(freq_to_wavelength(freq), radius,
+                                        mode)
+
+
+def _max_antenna_separation_full(wavelength: Union[float, np.ndarray],
+                                 radius: Union[float, np.ndarray],
+                                 mode: str) -> Union[float, np.ndarray]:
+    """Maximum antenna separation given the free-space wavelength in m"""
+
+    # * In 'cheeky' mode assume the pipe radius is 60% of the first
+    # * Fresnel zone as opposed to 100%
+    radius = radius / (_FRESNEL_ZONE_CLEARANCE.get(mode)
+                       or _FRESNEL_ZONE_CLEARANCE.get(mode.lower(), 1.0))
+
+    separation = (16 * radius ** 2 - wavelength ** 2) / (4 * wavelength)
+
+    return separation
+
+
+def max_antenna_separation_full(
+        freq: Union[float, np.ndarray], radius: Union[float, np.ndarray],
+        mode: str = 'normal') -> Union[float, np.ndarray]:
     """Maximum antenna separation for a given 1st Fresnel Zone
 
     This function calculates the maximum allowable distance between two
@@ -100,6 +135,9 @@ def max_antenna_separation_full(freq: float, radius: float,
         2. Depending on the combination of input values you might get negative
         separation. While mathematically correct, this does not have any
         physical meaning.
+        3. `freq` and `radius` can be array-like, in which case the usual
+        NumPy broadcasting rules apply. Results for single numbers are
+        memoised.
 
     Args:
         freq: A `float` with the frequency of interest. Units are GHz.
@@ -110,33 +148,48 @@ def max_antenna_separation_full(freq: float, radius: float,
 
     Returns:
         A single `float` number with the maximum separation between the two
-        antennas, with units in metres.
+        antennas, with units in metres, or an `np.ndarray` of separations
+        for array-like inputs.
 
     Raises:
         ZeroDivisionError: If the frequency has been given as zero.
     """
 
-    freq *= 1e9
+    if is_scalar(freq, radius):
+        return _max_antenna_separation_full_scalar(float(freq), float(radius),
+                                                   mode)
+
+    return _max_antenna_separation_full(freq_to_wavelength(freq),
+                                        np.asarray(radius), mode)
+
+
+@functools.lru_cache(maxsize=1024)
+def _max_antenna_separation_approx_scalar(freq: float, radius: float,
+                                          mode: str) -> float:
+    """Memoised single-value version of `max_antenna_separation_approx`"""
+
+    return _max_antenna_separation_approx(freq_to_wavelength(freq), radius,
+                                          mode)
 
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
 
-    # * Assume the pipe radius is 60% of the first Fresnel zone
-    # * as opposed to 100%
-    if 'cheeky' == mode.lower():
-        radius /= 0.6
+def _max_antenna_separation_approx(wavelength: Union[float, np.ndarray],
+                                   radius: Union[float, np.ndarray],
+                                   mode: str) -> Union[float, np.ndarray]:
+    """Maximum antenna separation given the free-space wavelength in m"""
 
-    separation = 16 * np.float_power(radius, 2) - np.float_power(wavelength, 2)
-    separation /= (4 * wavelength)
+    # * In 'cheeky' mode assume the pipe radius is 60% of the first
+    # * Fresnel zone as opposed to 100%
+    radius = radius / (_FRESNEL_ZONE_CLEARANCE.get(mode)
+                       or _FRESNEL_ZONE_CLEARANCE.get(mode.lower(), 1.0))
+
+    separation = 4 * radius ** 2 / wavelength
 
     return separation
 
 
-def max_antenna_separation_approx(freq: float, radius: float,
-                                  mode: str = 'normal') -> float:
+def max_antenna_separation_approx(
+        freq: Union[float, np.ndarray], radius: Union[float, np.ndarray],
+        mode: str = 'normal') -> Union[float, np.ndarray]:
     """Maximum antenna separation for a given 1st Fresnel Zone
 
     This function calculates the maximum allowable distance between two
@@ -148,6 +201,9 @@ def max_antenna_separation_approx(freq: float, radius: float,
         zone radius, which is the better-known and used one. However it assumes
         that the distance between transmitter and receiver is much, much larger
         than the wavelength, e.g. kilometres vs centimetres.
+        2. `freq` and `radius` can be array-like, in which case the usual
+        NumPy broadcasting rules apply. Results for single numbers are
+        memoised.
 
     Args:
         freq: A `float` with the frequency of interest. Units are GHz.
@@ -158,33 +214,41 @@ def max_antenna_separation_approx(freq: float, radius: float,
 
     Returns:
         A single `float` number with the maximum separation between the two
-        antennas, with units in metres.
+        antennas, with units in metres, or an `np.ndarray` of separations
+        for array-like inputs.
 
     Raises:
         ZeroDivisionError: If the frequency has been given as zero.
     """
 
-    freq *= 1e9
+    if is_scalar(freq, radius):
+        return _max_antenna_separation_approx_scalar(float(freq),
+                                                     float(radius), mode)
 
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+    return _max_antenna_separation_approx(freq_to_wavelength(freq),
+                                          np.asarray(radius), mode)
 
-    # * Assume the pipe radius is 60% of the first Fresnel zone
-    # * as opposed to 100%
-    if 'cheeky' == mode.lower():
-        radius /= 0.6
 
-    separation = 4 * np.float_power(radius, 2)
-    separation /= wavelength
+@functools.lru_cache(maxsize=1024)
+def _fresnel_zone_radius_scalar(freq: float, distance_1: float,
+                                distance_2: float) -> float:
+    """Memoised single-point version of `fresnel_zone_radius`"""
 
-    return separation
+    wavelength = freq_to_wavelength(freq)
+    total_distance = distance_1 + distance_2
+
+    if 0 == total_distance:
+        raise ZeroDivisionError('Distances must be > 0')
 
+    radius = wavelength * distance_1 * distance_2
+    radius /= total_distance
 
-def fresnel_zone_radius(freq: float, distance_1: float,
-                        distance_2: float) -> float:
+    return math.sqrt(radius)
+
+
+def fresnel_zone_radius(
+        freq: Union[float, np.ndarray], distance_1: Union[float, np.ndarray],
+        distance_2: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Calculates the radius of the 1st Fresnel zone
 
     Uses the well-known and used formula to find the radius of the
@@ -196,6 +260,9 @@ def fresnel_zone_radius(freq: float, distance_1: float,
         wavelength.
         2. The distances do not have to be the same, i.e. this is valid
         for any point along the length of the wireless link.
+        3. All arguments can be array-like, in which case the usual NumPy
+        broadcasting rules apply, e.g. for a frequency sweep. Results for
+        single numbers are memoised.
 
     Args:
         freq: A `float` with the frequency of interest. Units are GHz.
@@ -205,36 +272,77 @@ def fresnel_zone_radius(freq: float, distance_1: float,
                     to the point of interest. Units are in metres.
 
     Returns:
-        A single `float` with the radius of the 1st Fresnel zone.
-        Units are metres.
+        A single `float` with the radius of the 1st Fresnel zone, or an
+        `np.ndarray` of radii for array-like inputs. Units are metres.
 
     Raises:
         ZeroDivisionError: In case the frequency or both distances are
                            given as zero.
     """
 
-    freq *= 1e9
+    if is_scalar(freq, distance_1, distance_2):
+        return _fresnel_zone_radius_scalar(float(freq), float(distance_1),
+                                           float(distance_2))
+
+    wavelength = freq_to_wavelength(freq)
+    distance_1 = np.asarray(distance_1)
+    distance_2 = np.asarray(distance_2)
 
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+    total_distance = distance_1 + distance_2
 
-    try:
-        radius = wavelength * distance_1 * distance_2
-        radius /= (distance_1 + distance_2)
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Distances must be > 0'). \
-              with_traceback(error.__traceback__)
+    if np.any(total_distance == 0):
+        raise ZeroDivisionError('Distances must be > 0')
+
+    radius = wavelength * distance_1 * distance_2
+    radius /= total_distance
 
     radius = np.sqrt(radius)
 
     return radius
 
 
-def far_field_distance(freq: float, antenna_dimension: float,
-                       antenna_type: str = 'array') -> float:
+def _resonant_antenna_size(antenna_type: str) -> Optional[float]:
+    """Size of a resonant antenna in wavelengths, or None for other types"""
+
+    return _RESONANT_ANTENNA_SIZE.get(antenna_type) or \
+        _RESONANT_ANTENNA_SIZE.get(antenna_type.lower())
+
+
+@functools.lru_cache(maxsize=1024)
+def _far_field_distance_scalar(freq: float,
+                               antenna_dimension: Optional[float],
+                               antenna_type: str) -> float:
+    """Memoised single-value version of `far_field_distance`"""
+
+    return _far_field_distance(freq_to_wavelength(freq), antenna_dimension,
+                               antenna_type)
+
+
+def _far_field_distance(wavelength: Union[float, np.ndarray],
+                        antenna_dimension: Union[float, np.ndarray],
+                        antenna_type: str) -> Union[float, np.ndarray]:
+    """Far field boundary given the free-space wavelength in m"""
+
+    # * A monopole is assumed to be a quarter-wavelength resonator, and
+    # * a dipole to be a half-wavelength resonator
+    size = _resonant_antenna_size(antenna_type)
+
+    if size is not None:
+        dimension = size * wavelength
+    elif 'array' == antenna_type or 'array' == antenna_type.lower():
+        dimension = antenna_dimension * (wavelength / 2)
+    else:
+        dimension = antenna_dimension
+
+    distance = 2 * dimension ** 2 / wavelength
+
+    return distance
+
+
+def far_field_distance(
+        freq: Union[float, np.ndarray],
+        antenna_dimension: Union[float, np.ndarray],
+        antenna_type: str = 'array') -> Union[float, np.ndarray]:
     """Calculates far field boundary for an antenna
 
     Uses the well-established formula for far field region based on the
@@ -248,6 +356,9 @@ def far_field_distance(freq: float, antenna_dimension: float,
         3. In case of a monopole or dipole the antenna dimension is ignored as
         the antenna size is calculated from the free-space wavelength.
         4. Otherwise the units for the antenna dimension should be metres.
+        5. `freq` and `antenna_dimension` can be array-like, in which case
+        the usual NumPy broadcasting rules apply. Results for single numbers
+        are memoised.
 
     Args:
         freq: A `float` with the frequency at which the far field distance
@@ -260,32 +371,23 @@ def far_field_distance(freq: float, antenna_dimension: float,
                        `antenna_dimension` variable.
 
     Returns:
-        A single `float` with the minimum far field distance, with units in m.
+        A single `float` with the minimum far field distance, with units in m,
+        or an `np.ndarray` of distances for array-like inputs.
 
     Raises:
         ZeroDivisionError: If a frequency of zero is given.
     """
 
-    freq *= 1e9
+    if is_scalar(freq, antenna_dimension):
+        # * Resonant antennas ignore the dimension, so it is only converted,
+        # * and only becomes part of the memoised key, for the other types
+        if _resonant_antenna_size(antenna_type) is None:
+            antenna_dimension = float(antenna_dimension)
+        else:
+            antenna_dimension = None
 
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+        return _far_field_distance_scalar(float(freq), antenna_dimension,
+                                          antenna_type)
 
-    # * A monopole is assumed to be a quarter-wavelength resonator, and
-    # * a dipole to be a half-wavelength resonator
-    if 'monopole' == antenna_type.lower():
-        dimension = wavelength / 4.0
-    elif 'dipole' == antenna_type.lower():
-        dimension = wavelength / 2.0
-    elif 'array' == antenna_type.lower():
-        dimension = antenna_dimension * (wavelength / 2)
-    else:
-        dimension = antenna_dimension
-
-    distance = 2 * np.float_power(dimension, 2)
-    distance /= wavelength
-
-    return distance
+    return _far_field_distance(freq_to_wavelength(freq),
+                               np.asarray(antenna_dimension), antenna_type)
@@ -1,95 +1,175 @@
 """Conversions submodule
 
-Short and sweet functions to go between dB, Np, and magnitude. Might be more
-added in the future, when and if the need for those arises.
+Short and sweet functions to go between dB, Np, and magnitude, as well as
+from frequency to free-space wavelength. Might be more added in the future,
+when and if the need for those arises.
 """
 
+import functools
+import math
+from typing import Union
 import numpy as np
+from scipy.constants import speed_of_light
 
+from rflib._utils import is_scalar
 
-np.seterr(divide='raise', invalid='raise')
 
+# * Multiplier in front of the log10 for each of the supported dB modes
+_DB_MODE = {'power': 10.0, 'amplitude': 20.0}
 
-def nepers_to_db(nepers: float) -> float:
+# * One neper is 20 / ln(10) decibels
+_NP_TO_DB = 20.0 / math.log(10.0)
+_DB_TO_NP = math.log(10.0) / 20.0
+
+
+@functools.lru_cache(maxsize=4096)
+def _wavelength_ghz(freq: float) -> float:
+    """Memoised free-space wavelength, in m, for a frequency in GHz"""
+
+    return speed_of_light / (freq * 1e9)
+
+
+def freq_to_wavelength(
+        freq: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Converts frequency to free-space wavelength
+
+    Single frequencies are memoised, as the same handful of them tend to be
+    requested over and over when sweeping some other parameter. Array-like
+    frequencies are converted in one vectorised pass instead.
+
+    Args:
+        freq: A `float`, or an array-like of `float` values, with the
+              frequency. Units are GHz.
+
+    Returns:
+        The free-space wavelength in metres, as a `float` number or an
+        `np.ndarray` if `freq` is array-like.
+
+    Raises:
+        ZeroDivisionError: If the frequency, or any of the frequencies, is
+                           given as zero.
+    """
+
+    if is_scalar(freq):
+        if 0 == freq:
+            raise ZeroDivisionError('Frequency must be > 0')
+
+        return _wavelength_ghz(float(freq))
+
+    freq = np.asarray(freq)
+
+    if np.any(freq == 0):
+        raise ZeroDivisionError('Frequency must be > 0')
+
+    return speed_of_light / (freq * 1e9)
+
+
+def nepers_to_db(
+        nepers: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Converts nepers (Np) to decibels (dB)
 
     Used to move between natural log units to log 10 units, which are more
-    commonly used in communications engineering
+    commonly used in communications engineering. Accepts either a single value
+    or an array-like of values.
     """
 
-    return nepers * 8.685889638
+    if is_scalar(nepers):
+        return nepers * _NP_TO_DB
 
+    return np.asarray(nepers) * _NP_TO_DB
 
-def db_to_nepers(decibels: float) -> float:
+
+def db_to_nepers(
+        decibels: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
     """Converts decibels (dB) to nepers (Np)
 
     Used to move between log 10 units to natural log units, which are more
-    commonly used in most mathematical equations
+    commonly used in most mathematical equations. Accepts either a single
+    value or an array-like of values.
     """
 
-    return decibels * 0.115129255
+    if is_scalar(decibels):
+        return decibels * _DB_TO_NP
+
+    return np.asarray(decibels) * _DB_TO_NP
 
 
-def db_to_mag(value: float, mode: str = 'power') -> float:
+def db_to_mag(value: Union[float, np.ndarray],
+              mode: str = 'power') -> Union[float, np.ndarray]:
     """Convert from dB to magnitude
 
     Quick conversion between dB, i.e. logarithmic, and magnitude, i.e. linear
     values. Supports both power and amplitude conversions.
 
     Args:
-        value: A `float` with the value to convert.
+        value: A `float` or an array-like of `float` values to convert.
         mode: A `str` which determines whether to use 10 * log10 or 20 * log10.
               Must be either `power` or `amplitude`.
 
     Returns:
-        The magnitude as a `float` number.
+        The magnitude as a `float` number, or an `np.ndarray` of magnitudes
+        if `value` is array-like.
 
     Raises:
         ValueError: In case a mode different than `power` or `amplitude` is
                     specified.
     """
 
-    if 'power' == mode.lower():
-        mag = np.float_power(10, value / 10)
-    elif 'amplitude' == mode.lower():
-        mag = np.float_power(10, value / 20)
-    else:
+    divisor = _DB_MODE.get(mode) or _DB_MODE.get(mode.lower())
+
+    if divisor is None:
         raise ValueError('Mode must be power or amplitude')
 
+    if is_scalar(value):
+        try:
+            mag = 10.0 ** (value / divisor)
+        except OverflowError:
+            # * Saturate like the array path does rather than raising
+            mag = math.inf
+    else:
+        mag = 10.0 ** (np.asarray(value) / divisor)
+
     return mag
 
 
-def mag_to_db(value: float, mode: str = 'power') -> float:
+def mag_to_db(value: Union[float, np.ndarray],
+              mode: str = 'power') -> Union[float, np.ndarray]:
     """Convert from magnitude to dB
 
     Quick conversion between dB, i.e. logarithmic, and magnitude, i.e. linear
     values. Supports both power and amplitude conversions.
 
     Args:
-        value: A `float` with the value to convert.
+        value: A `float` or an array-like of `float` values to convert.
         mode: A `str` which determines whether to use 10 * log10 or 20 * log10.
               Must be either `power` or `amplitude`.
 
     Returns:
-        The dB value as a `float` number.
+        The dB value as a `float` number, or an `np.ndarray` of dB values
+        if `value` is array-like.
 
     Raises:
         ValueError: In case a mode different than `power` or `amplitude` is
                     specified. Additionally raised if `value` is given as a
-                    number that is <= 0.
+                    number, or contains numbers, that are <= 0.
     """
 
-    if 'power' == mode.lower():
-        mag = 10
-    elif 'amplitude' == mode.lower():
-        mag = 20
-    else:
+    mag = _DB_MODE.get(mode) or _DB_MODE.get(mode.lower())
+
+    if mag is None:
         raise ValueError('Mode must be power or amplitude')
 
-    try:
+    if is_scalar(value):
+        if value <= 0:
+            raise ValueError('Magnitude must be > 0')
+
+        mag *= math.log10(value)
+    else:
+        value = np.asarray(value)
+
+        if np.any(value <= 0):
+            raise ValueError('Magnitude must be > 0')
+
         mag *= np.log10(value)
-    except FloatingPointError as error:
-        raise ValueError('Magnitude must be > 0'). \
-              with_traceback(error.__traceback__)
 
     return mag
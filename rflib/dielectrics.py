@@ -12,20 +12,29 @@ Finally, there are implementations of the Cole-Cole single pole relaxation
 model and the Debye multipole one.
 """
 
-from typing import List
+from typing import List, Union
 import numpy as np
 from scipy.constants import epsilon_0
 
+from rflib._utils import cole_cole_dispersion, debye_dispersion, is_scalar
 
-np.seterr(divide='raise', invalid='raise')
 
+# * Conversion factors between conductivity in S/m and the imaginary part of
+# * the complex relative permittivity, for frequencies given in GHz
+_SIGMA_TO_EPSI_GHZ = 1.0 / (2.0 * np.pi * epsilon_0 * 1e9)
+_EPSI_TO_SIGMA_GHZ = 2.0 * np.pi * epsilon_0 * 1e9
 
-def conductivity_to_tan_delta(freq: float, conductivity: float,
-                              real_permittivity: float) -> float:
+
+def conductivity_to_tan_delta(
+        freq: Union[float, np.ndarray], conductivity: Union[float, np.ndarray],
+        real_permittivity: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """Converts between conductivity and loss tangent at a specific frequency
 
     This is a simple and straightforward conversion between the value of
     conductivity, in S/m, at a particular frequency, and a loss tangent.
+    All arguments can be array-like, in which case the usual NumPy
+    broadcasting rules apply.
 
     Args:
         freq: A `float` with the frequency, in GHz, at which to do the
@@ -35,7 +44,8 @@ def conductivity_to_tan_delta(freq: float, conductivity: float,
                            complex relative permittivity.
 
     Returns:
-        The value for the loss tangent, as a `float` number.
+        The value for the loss tangent, as a `float` number, or an
+        `np.ndarray` of values for array-like inputs.
 
     Raises:
         ValueError: If a negative value is provided for the permittivity or
@@ -43,15 +53,32 @@ def conductivity_to_tan_delta(freq: float, conductivity: float,
         ZeroDivisionError: If you specify 0 Hz, i.e. DC, for the frequency
     """
 
-    if (real_permittivity < 0) or (conductivity < 0):
+    if is_scalar(freq, conductivity, real_permittivity):
+        if (real_permittivity < 0) or (conductivity < 0):
+            raise ValueError('The real part of the permittivity and the'
+                             ' conductivity must be positive')
+
+        denominator = real_permittivity * freq
+
+        if 0 == denominator:
+            raise ZeroDivisionError('Real part and frequency must be > 0')
+
+        return _SIGMA_TO_EPSI_GHZ * conductivity / denominator
+
+    freq = np.asarray(freq)
+    conductivity = np.asarray(conductivity)
+    real_permittivity = np.asarray(real_permittivity)
+
+    if np.any(real_permittivity < 0) or np.any(conductivity < 0):
         raise ValueError('The real part of the permittivity and the'
                          ' conductivity must be positive')
 
-    try:
-        tan_delta = 17.97591 * conductivity / (real_permittivity * freq)
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Real part and frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+    denominator = real_permittivity * freq
+
+    if np.any(denominator == 0):
+        raise ZeroDivisionError('Real part and frequency must be > 0')
+
+    tan_delta = _SIGMA_TO_EPSI_GHZ * conductivity / denominator
 
     return tan_delta
 
@@ -80,10 +107,10 @@ def tan_delta_to_conductivity(freq: float, real_permittivity: float,
     if real_permittivity < 0:
         raise ValueError('The real part of the permittivity must be positive')
 
-    if np.isclose(freq, 0):
+    if 0 == freq:
         raise ValueError('Frequency must be > 0')
 
-    conductivity = 0.05563 * real_permittivity * tan_delta * freq
+    conductivity = _EPSI_TO_SIGMA_GHZ * real_permittivity * tan_delta * freq
 
     return conductivity
 
@@ -110,11 +137,10 @@ def complex_permittivity_to_tan_delta(real_permittivity: float,
                            of the permittivity.
     """
 
-    try:
-        tan_delta = np.abs(imag_permittivity) / np.abs(real_permittivity)
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Real part must be > 0'). \
-              with_traceback(error.__traceback__)
+    if 0 == real_permittivity:
+        raise ZeroDivisionError('Real part must be > 0')
+
+    tan_delta = abs(imag_permittivity) / abs(real_permittivity)
 
     return tan_delta
 
@@ -140,10 +166,10 @@ def imaginary_permittivity_to_conductivity(freq: float,
         ZeroDivisionError: If you specify 0 Hz, i.e. DC, for the frequency
     """
 
-    if np.isclose(freq, 0):
+    if 0 == freq:
         raise ZeroDivisionError('Frequency must be > 0')
 
-    conductivity = 0.05563 * freq * np.abs(imag_permittivity)
+    conductivity = _EPSI_TO_SIGMA_GHZ * freq * abs(imag_permittivity)
 
     return conductivity
 
@@ -169,23 +195,29 @@ def conductivity_to_imaginary_permittivity(freq: float,
         ZeroDivisionError: If you specify 0 Hz, i.e. DC, for the frequency
     """
 
-    try:
-        imag_permittivity = 17.97591 * conductivity / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+    if 0 == freq:
+        raise ZeroDivisionError('Frequency must be > 0')
+
+    imag_permittivity = _SIGMA_TO_EPSI_GHZ * conductivity / freq
 
     return imag_permittivity
 
 
-def equivalent_relative_permittivity(epsilon_real: List[float],
-                                     thicknesses: List[float]) -> float:
+def equivalent_relative_permittivity(
+        epsilon_real: Union[List[float], np.ndarray],
+        thicknesses: Union[List[float], np.ndarray]
+) -> Union[float, np.ndarray]:
     """Calculate equivalent relative permittivity of multi-layer media
 
     Uses the low-frequency approximation for equivalent real part of the
     relative permittivity of a multi-layer dielectric media. This approximation
     is valid up to about 100 GHz.
 
+    Notes:
+        1. The layers are taken along the last axis of the inputs, so several
+        multi-layer media can be evaluated at once by passing 2D arrays with
+        one row per medium.
+
     Args:
         epsilon_real: A `List` of `float` values for the real part of the
                       relative permittivity of the individual layers.
@@ -194,7 +226,8 @@ def equivalent_relative_permittivity(epsilon_real: List[float],
                      are all the same.
 
     Returns:
-        A `float` with the equivalent relative permittivity.
+        A `float` with the equivalent relative permittivity, or an
+        `np.ndarray` with one value per medium for 2D inputs.
 
     Raises:
         ZeroDivisionError: In case the total thickness is zero, or a
@@ -202,23 +235,25 @@ def equivalent_relative_permittivity(epsilon_real: List[float],
                            zero.
     """
 
-    total_thickness = np.sum(thicknesses)
-    epsilon_real_eff = 0.0
+    epsilon_real = np.asarray(epsilon_real, dtype=np.float64)
+    thicknesses = np.asarray(thicknesses, dtype=np.float64)
+
+    total_thickness = np.sum(thicknesses, axis=-1)
 
-    try:
-        for er_eff, ind_thickness in zip(epsilon_real, thicknesses):
-            epsilon_real_eff += (ind_thickness / (er_eff * total_thickness))
-        epsilon_real_eff = 1 / epsilon_real_eff
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('One or more arguments evaluate to zero'). \
-              with_traceback(error.__traceback__)
+    if np.any(epsilon_real == 0) or np.any(total_thickness == 0):
+        raise ZeroDivisionError('One or more arguments evaluate to zero')
+
+    # * The total thickness cancels out of the sum over the layers, leaving
+    # * a single division and reduction
+    epsilon_real_eff = total_thickness / np.sum(thicknesses / epsilon_real,
+                                                axis=-1)
 
     return epsilon_real_eff
 
 
-def cole_cole_single(freq: float, er_static: float, er_inf: float,
-                     cond_static: float, relax_time: float,
-                     alpha: float) -> complex:
+def cole_cole_single(freq: Union[float, np.ndarray], er_static: float,
+                     er_inf: float, cond_static: float, relax_time: float,
+                     alpha: float) -> Union[complex, np.ndarray]:
     """Single-pole Cole-Cole model
 
     This function implements the single-pole Cole-Cole dielectric relaxation
@@ -226,8 +261,9 @@ def cole_cole_single(freq: float, er_static: float, er_inf: float,
     various dielectric materials.
 
     Args:
-        freq: A `float` with the frequency at which to calculate the complex
-              relative permittivity. Units are GHz.
+        freq: A `float`, or an array-like of `float` values, with the
+              frequency at which to calculate the complex relative
+              permittivity. Units are GHz.
         er_static: A `float` with the material's relative permittivity at 0 Hz
         er_inf: A `float` with the material's relative permittivity at infinity
         cond_static: A `float` with the material's static electrical
@@ -237,33 +273,41 @@ def cole_cole_single(freq: float, er_static: float, er_inf: float,
         alpha: A `float` coefficient describing the pole broadening.
 
     Returns:
-        A single `complex` number of the form `e_real - j * e_imag`.
+        A single `complex` number of the form `e_real - j * e_imag`, or an
+        `np.ndarray` of those if `freq` is array-like.
 
     Raises:
         ZeroDivisionError: In case the frequency is given as 0 Hz.
     """
 
-    freq *= 1e9
-    ang_freq = 2 * np.pi * freq
+    if is_scalar(freq):
+        # * Stay with Python floats so that the result is a plain `complex`
+        freq = float(freq)
+
+        if 0 == freq:
+            raise ZeroDivisionError('Frequency must be > 0')
+    else:
+        freq = np.asarray(freq)
 
-    try:
-        er_complex_1 = cond_static / (1j * ang_freq * epsilon_0)
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
+        if np.any(freq == 0):
+            raise ZeroDivisionError('Frequency must be > 0')
 
-    er_complex_2 = er_static - er_inf
-    temp_base = 1j * ang_freq * relax_time
-    er_complex_2 /= (1 + np.power(temp_base, 1 - alpha))
+    ang_freq = 2 * np.pi * freq * 1e9
+    er_complex_1 = cond_static / (1j * ang_freq * epsilon_0)
+
+    er_complex_2 = cole_cole_dispersion(ang_freq, er_static, er_inf,
+                                        relax_time, alpha)
 
     er_complex = er_inf + er_complex_2 + er_complex_1
 
     return er_complex
 
 
-def debye_multipole(freq: float, er_inf: float, cond_static: float,
-                    relax_times: List[float],
-                    er_disps: List[float]) -> complex:
+def debye_multipole(freq: Union[float, np.ndarray], er_inf: float,
+                    cond_static: float,
+                    relax_times: Union[List[float], np.ndarray],
+                    er_disps: Union[List[float], np.ndarray]
+                    ) -> Union[complex, np.ndarray]:
     """Multipole Debye model
 
     This function implements the multipole Debye dielectric relaxation
@@ -271,17 +315,20 @@ def debye_multipole(freq: float, er_inf: float, cond_static: float,
     various dielectric materials.
 
     Args:
-        freq: A `float` with the frequency at which to calculate the complex
-              relative permittivity. Units are GHz.
+        freq: A `float`, or an array-like of `float` values, with the
+              frequency at which to calculate the complex relative
+              permittivity. Units are GHz.
         er_inf: A `float` with the material's relative permittivity at infinity
         cond_static: A `float` with the material's static electrical
                      conductivity. Units are S/m.
-        relax_times: A `List` of `float` with the material's relaxation times.
-                     Units are seconds.
-        er_disps: A `List` of `float` with the material's pole amplitudes.
+        relax_times: A `List` or 1D `np.ndarray` of `float` with the
+                     material's relaxation times. Units are seconds.
+        er_disps: A `List` or 1D `np.ndarray` of `float` with the material's
+                  pole amplitudes.
 
     Returns:
-        A single `complex` number of the form `e_real - j * e_imag`.
+        A single `complex` number of the form `e_real - j * e_imag`, or an
+        `np.ndarray` of those if `freq` is array-like.
 
     Raises:
         RuntimeError: In case a different number of relaxation times and
@@ -294,18 +341,25 @@ def debye_multipole(freq: float, er_inf: float, cond_static: float,
             'Need same number of relaxation times and pole amplitudes'
         )
 
-    freq *= 1e9
-    ang_freq = 2 * np.pi * freq
+    if is_scalar(freq):
+        # * Stay with Python floats so that the result is a plain `complex`
+        freq = float(freq)
+
+        if 0 == freq:
+            raise ZeroDivisionError('Frequency must be > 0.')
+    else:
+        freq = np.asarray(freq)
+
+        if np.any(freq == 0):
+            raise ZeroDivisionError('Frequency must be > 0.')
+
+        relax_times = np.asarray(relax_times, dtype=np.float64)
+        er_disps = np.asarray(er_disps, dtype=np.float64)
 
-    try:
-        er_complex_1 = cond_static / (1j * ang_freq * epsilon_0)
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0.'). \
-              with_traceback(error.__traceback__)
+    ang_freq = 2 * np.pi * freq * 1e9
+    er_complex_1 = cond_static / (1j * ang_freq * epsilon_0)
 
-    er_complex_2 = 0 + 0j
-    for t_relax, er_disp in zip(relax_times, er_disps):
-        er_complex_2 += (er_disp / (1 + (1j * ang_freq * t_relax)))
+    er_complex_2 = debye_dispersion(ang_freq, relax_times, er_disps)
 
     er_complex = er_inf + er_complex_2 + er_complex_1
 
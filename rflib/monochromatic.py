@@ -0,0 +1,130 @@
+"""Monochromatic submodule
+
+Helpers for analyses carried out at a single, fixed frequency, e.g. a link
+at a known carrier frequency evaluated for many different materials. The
+frequency-dependent quantities are worked out once, and the returned
+functions only deal with what changes between calls.
+"""
+
+import math
+from types import SimpleNamespace
+from typing import List, Union
+import numpy as np
+from scipy.constants import epsilon_0, mu_0
+
+from rflib import antennas, propagation
+from rflib._utils import cole_cole_dispersion, debye_dispersion, is_scalar
+from rflib.conversions import freq_to_wavelength
+
+
+def for_frequency(freq: float) -> SimpleNamespace:
+    """Specialises the frequency-dependent functions to a single frequency
+
+    The wavelength, angular frequency, and other constant factors are
+    precomputed, and closures equivalent to `skin_depth`,
+    `fresnel_zone_radius`, `cole_cole_single`, and `debye_multipole` are
+    returned with the frequency already bound.
+
+    Notes:
+        1. The closures take the same arguments as the original functions,
+        minus `freq`, and raise the same exceptions for invalid inputs.
+        2. `skin_depth` and `fresnel_zone_radius` fall back to the original
+        functions for array-like arguments.
+
+    Args:
+        freq: A `float` with the frequency of interest. Units are GHz.
+
+    Returns:
+        A `SimpleNamespace` with the attributes `freq`, `wavelength` in m,
+        `ang_freq` in rad/s, and the functions `skin_depth`,
+        `fresnel_zone_radius`, `cole_cole_single`, and `debye_multipole`.
+
+    Raises:
+        ZeroDivisionError: If the frequency is given as 0 Hz.
+        ValueError: If the frequency is negative.
+    """
+
+    if 0 == freq:
+        raise ZeroDivisionError('Frequency must be > 0')
+
+    if freq < 0:
+        raise ValueError('Frequency must be > 0')
+
+    freq = float(freq)
+    wavelength = freq_to_wavelength(freq)
+    ang_freq = 2 * math.pi * freq * 1e9
+
+    skin_depth_root = math.sqrt(math.pi * (freq * 1e9) * mu_0)
+    conduction_factor = 1 / (1j * ang_freq * epsilon_0)
+
+    def skin_depth(
+            conductivity: Union[float, np.ndarray],
+            real_permeability: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """`propagation.skin_depth` at the bound frequency"""
+
+        if not is_scalar(conductivity, real_permeability):
+            return propagation.skin_depth(freq, conductivity,
+                                          real_permeability)
+
+        delta = conductivity * real_permeability
+
+        if delta < 0:
+            raise RuntimeError('All variables must be > 0')
+
+        if 0 == delta:
+            raise ZeroDivisionError('Variable values must be > 0')
+
+        return 1 / (skin_depth_root * math.sqrt(delta))
+
+    def fresnel_zone_radius(
+            distance_1: Union[float, np.ndarray],
+            distance_2: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """`antennas.fresnel_zone_radius` at the bound frequency"""
+
+        if not is_scalar(distance_1, distance_2):
+            return antennas.fresnel_zone_radius(freq, distance_1, distance_2)
+
+        total_distance = distance_1 + distance_2
+
+        if 0 == total_distance:
+            raise ZeroDivisionError('Distances must be > 0')
+
+        radius = wavelength * distance_1 * distance_2
+        radius /= total_distance
+
+        return math.sqrt(radius)
+
+    def cole_cole_single(er_static: float, er_inf: float, cond_static: float,
+                         relax_time: float, alpha: float) -> complex:
+        """`dielectrics.cole_cole_single` at the bound frequency"""
+
+        er_complex_2 = cole_cole_dispersion(ang_freq, er_static, er_inf,
+                                            relax_time, alpha)
+
+        return er_inf + er_complex_2 + cond_static * conduction_factor
+
+    def debye_multipole(er_inf: float, cond_static: float,
+                        relax_times: Union[List[float], np.ndarray],
+                        er_disps: Union[List[float], np.ndarray]) -> complex:
+        """`dielectrics.debye_multipole` at the bound frequency"""
+
+        if len(relax_times) != len(er_disps):
+            raise RuntimeError(
+                'Need same number of relaxation times and pole amplitudes'
+            )
+
+        er_complex_2 = debye_dispersion(ang_freq, relax_times, er_disps)
+
+        return er_inf + er_complex_2 + cond_static * conduction_factor
+
+    return SimpleNamespace(
+        freq=freq,
+        wavelength=wavelength,
+        ang_freq=ang_freq,
+        skin_depth=skin_depth,
+        fresnel_zone_radius=fresnel_zone_radius,
+        cole_cole_single=cole_cole_single,
+        debye_multipole=debye_multipole,
+    )
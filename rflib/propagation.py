@@ -4,20 +4,36 @@ A few functions vaguely related to electromagnetic propagation in conductors
 and dielectrics.
 """
 
-from typing import Tuple
+import math
+from typing import Tuple, Union
 import numpy as np
-from scipy.constants import epsilon_0, mu_0, speed_of_light
+from scipy.constants import epsilon_0, mu_0
 
+from rflib._utils import is_scalar
+from rflib.conversions import freq_to_wavelength
 
-np.seterr(divide='raise', invalid='raise')
 
+_FREE_SPACE_IMPEDANCE = math.sqrt(mu_0 / epsilon_0)
 
-def skin_depth(freq: float, conductivity: float,
-               real_permeability: float) -> float:
+
+def _sqrt(value: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Square root that only goes through NumPy for array arguments"""
+
+    if is_scalar(value):
+        return math.sqrt(value)
+
+    return np.sqrt(value)
+
+
+def skin_depth(freq: Union[float, np.ndarray],
+               conductivity: Union[float, np.ndarray],
+               real_permeability: Union[float, np.ndarray]
+               ) -> Union[float, np.ndarray]:
     """Calculates skin depth for a particular metal at a particular frequency
 
     Uses the well-known formula for metal skin depth, with some additional
-    error-checking to prevent runtime errors.
+    error-checking to prevent runtime errors. All arguments can be array-like,
+    in which case the usual NumPy broadcasting rules apply.
 
     Args:
         freq: A `float` with the frequency at which we want to know the skin
@@ -29,7 +45,7 @@ def skin_depth(freq: float, conductivity: float,
 
     Returns:
         A single `float` with the skin depth in metres, due to using base
-        units in the function.
+        units in the function, or an `np.ndarray` for array-like inputs.
 
     Raises:
         RuntimeError: If for whatever reason one or more of the input
@@ -40,23 +56,72 @@ def skin_depth(freq: float, conductivity: float,
 
     # ? Add database of metals and their properties
 
-    freq *= 1e9
+    if is_scalar(freq, conductivity, real_permeability):
+        delta = math.pi * (freq * 1e9) * conductivity * mu_0 * \
+                real_permeability
+
+        if delta < 0:
+            raise RuntimeError('All variables must be > 0')
+
+        if 0 == delta:
+            raise ZeroDivisionError('Variable values must be > 0')
+
+        return 1 / math.sqrt(delta)
+
+    freq = np.asarray(freq) * 1e9
+    conductivity = np.asarray(conductivity)
+    real_permeability = np.asarray(real_permeability)
 
     delta = np.pi * freq * conductivity * mu_0 * real_permeability
-    delta = np.sqrt(delta)
 
-    if np.isnan(delta):
+    if np.any(delta < 0):
         raise RuntimeError('All variables must be > 0')
 
-    try:
-        delta = 1 / delta
-    except (ZeroDivisionError, FloatingPointError) as error:
-        raise ZeroDivisionError('Variable values must be > 0'). \
-              with_traceback(error.__traceback__)
+    if np.any(delta == 0):
+        raise ZeroDivisionError('Variable values must be > 0')
+
+    delta = 1 / np.sqrt(delta)
 
     return delta
 
 
+def skin_depth_batched(freq: np.ndarray, conductivity: np.ndarray,
+                       real_permeability: np.ndarray) -> np.ndarray:
+    """Calculates skin depth for several metals over several frequencies
+
+    Evaluates `skin_depth` on the full grid of frequencies and metals in a
+    single vectorised pass, instead of one call per combination.
+
+    Notes:
+        1. The metals are described structure-of-arrays style, i.e. one
+        array of conductivities and one of permeabilities, with the same
+        index referring to the same metal in both.
+
+    Args:
+        freq: A 1D array-like of `float` values with the frequencies at which
+              we want to know the skin depth. Units are GHz.
+        conductivity: A 1D array-like of `float` values with each metal's
+                      conductivity. Units are S/m.
+        real_permeability: A 1D array-like of `float` values with each
+                           metal's relative permeability. Unitless.
+
+    Returns:
+        A 2D `np.ndarray` with the skin depths in metres, with one row per
+        frequency and one column per metal.
+
+    Raises:
+        RuntimeError: If for whatever reason one or more of the input
+                      variables are negative.
+        ZeroDivisionError: If for whatever reason one or more of the input
+                           variables are zero.
+    """
+
+    freq = np.reshape(np.asarray(freq, dtype=np.float64), (-1, 1))
+
+    return skin_depth(freq, np.asarray(conductivity, dtype=np.float64),
+                      np.asarray(real_permeability, dtype=np.float64))
+
+
 def metal_resistance(freq: float, conductivity: float,
                      real_permeability: float) -> float:
     """Calculates frequency-dependent metal resistance
@@ -81,28 +146,50 @@ def metal_resistance(freq: float, conductivity: float,
     """
 
     metal_skin_depth = skin_depth(freq, conductivity, real_permeability)
+    wavelength = freq_to_wavelength(freq)
 
-    freq *= 1e9
-
-    try:
-        wavelength = speed_of_light / freq
-    except ZeroDivisionError as error:
-        raise ZeroDivisionError('Frequency must be > 0'). \
-              with_traceback(error.__traceback__)
-
-    resistance = np.pi * np.sqrt(mu_0 / epsilon_0)
+    resistance = np.pi * _FREE_SPACE_IMPEDANCE
     resistance *= (metal_skin_depth / wavelength)
 
     return resistance
 
 
-def plane_wave_prop_const(freq: float, real_permittivity: float,
-                          imag_permittivity: float,
-                          real_permeability: float) -> Tuple[float, float]:
+def _plane_wave_kernel(
+        ang_freq: Union[float, np.ndarray],
+        real_permittivity: Union[float, np.ndarray],
+        imag_permittivity: Union[float, np.ndarray],
+        real_permeability: Union[float, np.ndarray]
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
+    """Attenuation and phase constants of a plane wave
+
+    Works directly on the angular frequency in rad/s and on the absolute,
+    rather than relative, permittivity and permeability. Input validation is
+    left to `plane_wave_prop_const`.
+    """
+
+    loss_ratio = imag_permittivity / real_permittivity
+    common_root = _sqrt(1 + loss_ratio * loss_ratio)
+
+    common_multiplier = (real_permeability * real_permittivity) / 2.0
+
+    alpha = ang_freq * _sqrt(common_multiplier * (common_root - 1))
+    beta = ang_freq * _sqrt(common_multiplier * (common_root + 1))
+
+    return (alpha, beta)
+
+
+def plane_wave_prop_const(
+        freq: Union[float, np.ndarray],
+        real_permittivity: Union[float, np.ndarray],
+        imag_permittivity: Union[float, np.ndarray],
+        real_permeability: Union[float, np.ndarray]
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
     """Calculate the complex propagation constant in homogeneous medium
 
     The general-case formula is used to find the attenuation constant in Np/m
     and the phase constant in rad/m of a planar EM wave in homogeneous medium.
+    All arguments can be array-like, in which case the usual NumPy
+    broadcasting rules apply, e.g. for a frequency sweep.
 
     Args:
         freq: A `float` with the frequency of interest. Units are GHz.
@@ -115,7 +202,8 @@ def plane_wave_prop_const(freq: float, real_permittivity: float,
 
     Returns:
         A `tuple` consisting of `float` values for the attenuation constant
-        `alpha` and the phase constant `beta`. Units are Np/m and rad/m.
+        `alpha` and the phase constant `beta`. Units are Np/m and rad/m. For
+        array-like inputs the `tuple` holds two `np.ndarray` instead.
 
     Raises:
         ZeroDivisionError: If the real part of the relative permittivity is
@@ -124,38 +212,35 @@ def plane_wave_prop_const(freq: float, real_permittivity: float,
                       negative
     """
 
-    imag_permittivity = np.abs(imag_permittivity)
-
-    real_permittivity *= epsilon_0
-    imag_permittivity *= epsilon_0
-    real_permeability *= mu_0
-
-    freq *= 1e9
-    ang_freq = 2 * np.pi * freq
-
-    try:
-        common_root = (
-            1 + np.float_power(imag_permittivity / real_permittivity, 2)
-        )
-    except (ZeroDivisionError, FloatingPointError) as error:
-        raise ZeroDivisionError('Real relative permittivity must be >= 1'). \
-              with_traceback(error.__traceback__)
+    if is_scalar(freq, real_permittivity, imag_permittivity,
+                 real_permeability):
+        real_permittivity = float(real_permittivity) * epsilon_0
+        imag_permittivity = abs(float(imag_permittivity)) * epsilon_0
+        real_permeability = float(real_permeability) * mu_0
 
-    common_root = np.sqrt(common_root)
+        ang_freq = 2 * math.pi * (float(freq) * 1e9)
 
-    if np.isnan(common_root):
-        raise RuntimeError('All variables must be > 0')
-
-    common_multiplier = (real_permeability * real_permittivity) / 2.0
+        if 0 == real_permittivity:
+            raise ZeroDivisionError('Real relative permittivity must be >= 1')
 
-    alpha = ang_freq * np.sqrt(common_multiplier * (common_root - 1))
+        # * The common root is always >= 1, so the square root arguments can
+        # * only go negative through the sign of the permittivity-permeability
+        # * product. Checking that once replaces checking alpha and beta
+        if real_permeability * real_permittivity < 0:
+            raise RuntimeError('All variables must be > 0')
+    else:
+        real_permittivity = np.asarray(real_permittivity) * epsilon_0
+        imag_permittivity = np.abs(imag_permittivity) * epsilon_0
+        real_permeability = np.asarray(real_permeability) * mu_0
 
-    if np.isnan(alpha):
-        raise RuntimeError('All variables must be > 0')
+        freq = np.asarray(freq) * 1e9
+        ang_freq = 2 * np.pi * freq
 
-    beta = ang_freq * np.sqrt(common_multiplier * (common_root + 1))
+        if np.any(real_permittivity == 0):
+            raise ZeroDivisionError('Real relative permittivity must be >= 1')
 
-    if np.isnan(beta):
-        raise RuntimeError('All variables must be > 0')
+        if np.any(real_permeability * real_permittivity < 0):
+            raise RuntimeError('All variables must be > 0')
 
-    return (alpha, beta)
+    return _plane_wave_kernel(ang_freq, real_permittivity, imag_permittivity,
+                              real_permeability)